@@ -0,0 +1,178 @@
+"""
+Shared market data helpers for the dashboard and the briefing script
+HTTP session, on-disk response cache, Fear & Greed fetch and sentiment bands
+"""
+
+import bisect
+import hashlib
+import os
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+# Prefer orjson when installed; fall back to the stdlib
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    loads = json.loads
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+# Paths and endpoints
+CACHE_DIR = Path(__file__).parent / ".cache"
+FNG_URL = "https://api.alternative.me/fng/"
+FNG_CACHE_TTL = 3600  # index only updates daily
+
+
+class Sentiment(NamedTuple):
+    """How a Fear & Greed reading is presented in the GUI and the briefing."""
+    signal: str      # short GUI signal
+    label: str       # index classification
+    color: str       # dashboard palette field
+    headline: str    # briefing sentiment line
+    advice: str
+
+
+# Fear & Greed bands: upper bounds (inclusive) and their presentation
+_THRESHOLDS = (25, 40, 60, 75)
+_SENTIMENTS = (
+    Sentiment("🟢 BUY OPPORTUNITY", "Extreme Fear", "success",
+              "🟢 BUY OPPORTUNITY — Extreme Fear",
+              "Contrarian signal. High fear often precedes rallies."),
+    Sentiment("🟡 CAUTIOUS", "Fear", "warning",
+              "🟡 CAUTIOUS OPTIMISM — Fear",
+              "Building positions on dips."),
+    Sentiment("⚪ NEUTRAL", "Neutral", "text",
+              "⚪ NEUTRAL",
+              "No strong directional signal."),
+    Sentiment("🟠 CAUTION", "Greed", "warning",
+              "🟠 CAUTION — Greed",
+              "Momentum slowing. Watch for exhaustion."),
+    Sentiment("🔴 TAKE PROFITS", "Extreme Greed", "danger",
+              "🔴 TAKE PROFITS — Extreme Greed",
+              "Market likely overextended."),
+)
+
+
+@lru_cache(maxsize=None)
+def session() -> "requests.Session":
+    """Shared HTTP session; requests is only imported on first network use."""
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError as e:
+        raise ImportError("Install: pip install requests") from e
+    
+    # Reuses TCP/TLS connections across fetches
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16,
+                                    max_retries=Retry(total=2, backoff_factor=0.3)))
+    s.headers.update({"Accept-Encoding": "gzip", "User-Agent": "daily-intel/1.0"})
+    return s
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write via a private temp file and rename it into place.
+    
+    Readers never see a partial file, and concurrent writers (the GUI and a
+    cron/daemon briefing share the cache) never clobber each other's temp.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".",
+                                     suffix=".tmp", delete=False) as tmp:
+        tmp.write(data)
+    try:
+        os.replace(tmp.name, path)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+
+
+def cached_get_json(url: str, ttl: int, timeout: int = 10) -> Dict:
+    """GET a JSON URL, serving it from the on-disk cache while fresh.
+    
+    Once the TTL expires the request is revalidated with the stored ETag /
+    Last-Modified, so an unchanged resource costs a 304 instead of a body.
+    """
+    cache_path = CACHE_DIR / (hashlib.sha1(url.encode()).hexdigest() + ".json")
+    meta_path = cache_path.with_suffix(".meta")
+    try:
+        cached = loads(cache_path.read_bytes())
+        if cache_path.stat().st_mtime > time.time() - ttl:
+            return cached
+    except (OSError, ValueError):
+        cached = None
+    
+    headers = {}
+    if cached is not None:
+        try:
+            meta = loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    
+    try:
+        response = session().get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and cached is not None:
+            try:
+                os.utime(cache_path, None)
+            except OSError:
+                pass
+            return cached
+        response.raise_for_status()
+        data = loads(response.content)
+    except Exception:
+        # A stale copy beats no data when revalidation fails
+        if cached is None:
+            raise
+        return cached
+    
+    # Cache writes are best-effort; the fetched body is returned regardless
+    try:
+        write_atomic(cache_path, response.content)
+        write_atomic(meta_path, dumps({
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }))
+    except OSError:
+        pass
+    return data
+
+
+def get_fear_greed_index(on_error: Optional[Callable[[str], None]] = None) -> Dict:
+    """Fetch market Fear & Greed Index, falling back to neutral on error."""
+    try:
+        data = cached_get_json(FNG_URL, ttl=FNG_CACHE_TTL)
+        if data.get("data"):
+            latest = data["data"][0]
+            return {
+                "value": int(latest.get("value", 50)),
+                "classification": latest.get("value_classification", "Neutral"),
+            }
+    except Exception as e:
+        if on_error is not None:
+            on_error(f"Fear/Greed fetch error: {e}")
+    return {"value": 50, "classification": "Neutral"}
+
+
+def analyze_sentiment(value: int) -> Sentiment:
+    """Map a Fear & Greed value to its sentiment band."""
+    return _SENTIMENTS[bisect.bisect_left(_THRESHOLDS, value)]
@@ -5,34 +5,67 @@ Launch from Ubuntu launcher
 Fallback to CLI if tkinter unavailable
 """
 
-import json
+import heapq
 import os
+import queue
 import sys
+import threading
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple
+
+import _marketlib
+from _marketlib import dumps as _dumps, loads as _loads
 
 # Try GUI first, fall back to CLI
 GUI_AVAILABLE = False
 try:
-    from tkinter import *
-    from tkinter import messagebox, scrolledtext
+    from tkinter import (
+        BOTH, BOTTOM, DISABLED, END, LEFT, NORMAL, RIGHT, TOP, W, WORD, X,
+        Entry, PhotoImage, Tk, Toplevel,
+    )
+    from tkinter import messagebox, scrolledtext, ttk
     GUI_AVAILABLE = True
 except ImportError:
     pass
 
-try:
-    import requests
-    from bs4 import BeautifulSoup
-except ImportError:
-    print("Install dependencies: pip install --break-system-packages requests beautifulsoup4")
-    sys.exit(1)
-
 
 # Paths
 APP_DIR = Path(__file__).parent
 CONFIG_FILE = APP_DIR / "config.json"
 BRIEFINGS_DIR = APP_DIR / "briefings"
+HISTORY_LIMIT = 10
+HISTORY_PREVIEW_CHARS = 2000
+REFRESH_DEBOUNCE_NS = 500_000_000  # drop refresh clicks within 500ms
+REFRESH_POLL_MS = 50
+_DATE_FMT = "%b %d, %Y • %H:%M"
+
+
+class Palette(NamedTuple):
+    """Dashboard color scheme."""
+    bg: str
+    header_bg: str
+    card_bg: str
+    text: str
+    accent: str
+    success: str
+    warning: str
+    danger: str
+
+
+# Shared worker pool for network fetches
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+
+def _read_preview(entry):
+    """Read only the preview prefix of a briefing file."""
+    # UTF-8 is at most 4 bytes per character
+    with open(entry.path, "rb") as fh:
+        prefix = fh.read(4 * HISTORY_PREVIEW_CHARS)
+    return prefix.decode("utf-8", "replace")[:HISTORY_PREVIEW_CHARS]
 
 
 def cli_main():
@@ -54,8 +87,8 @@ Current Market Status:
     
     # Show quick status
     try:
-        resp = requests.get("https://api.alternative.me/fng/", timeout=5)
-        data = resp.json()
+        data = _marketlib.cached_get_json(_marketlib.FNG_URL, ttl=_marketlib.FNG_CACHE_TTL,
+                                          timeout=5)
         if data.get("data"):
             fg = data["data"][0]
             print(f"  Fear & Greed: {fg.get('value')}/100 ({fg.get('value_classification')})")
@@ -80,10 +113,18 @@ class MarketDashboardApp:
         self.root.geometry("900x700")
         self.root.minsize(700, 500)
         
+        # Status messages from worker threads, drained on the Tk thread
+        self._log_queue = queue.SimpleQueue()
+        
         # Make it look modern
         self.root.configure(bg="#1a1a2e")
         self.setup_styles()
         
+        # Refresh guard state
+        self._refreshing = False
+        self._last_refresh_ns = 0
+        self._pending = ()
+        
         # Build UI
         self.create_header()
         self.create_market_summary()
@@ -99,103 +140,117 @@ class MarketDashboardApp:
     
     def setup_styles(self):
         """Configure custom styles."""
-        self.styles = {
-            "bg": "#1a1a2e",
-            "header_bg": "#16213e",
-            "card_bg": "#0f3460",
-            "text": "#eaeaea",
-            "accent": "#e94560",
-            "success": "#4ecca3",
-            "warning": "#ffc107",
-            "danger": "#e94560",
-        }
+        self.styles = Palette(
+            bg="#1a1a2e",
+            header_bg="#16213e",
+            card_bg="#0f3460",
+            text="#eaeaea",
+            accent="#e94560",
+            success="#4ecca3",
+            warning="#ffc107",
+            danger="#e94560",
+        )
+        
+        # Register named ttk styles once instead of passing colors per widget
+        style = ttk.Style(self.root)
+        style.theme_use("clam")
+        
+        style.configure("Header.TFrame", background=self.styles.header_bg)
+        style.configure("Header.TLabel", background=self.styles.header_bg,
+                        foreground=self.styles.text, font=("Helvetica", 10))
+        style.configure("Title.Header.TLabel", font=("Helvetica", 18, "bold"))
+        
+        style.configure("Card.TFrame", background=self.styles.card_bg)
+        style.configure("Card.TLabel", background=self.styles.card_bg,
+                        foreground=self.styles.text, font=("Helvetica", 12))
+        style.configure("Title.Card.TLabel", font=("Helvetica", 14, "bold"))
+        style.configure("Signal.Card.TLabel", foreground=self.styles.warning,
+                        font=("Helvetica", 11, "bold"))
+        
+        style.configure("Status.TLabel", background=self.styles.header_bg,
+                        foreground=self.styles.text, font=("Helvetica", 9),
+                        padding=(10, 0))
+        
+        style.configure("Dialog.TLabel", background=self.styles.bg,
+                        foreground=self.styles.text)
+        style.configure("Title.Dialog.TLabel", font=("Helvetica", 14, "bold"))
+        
+        for name, color in (("Accent.TButton", self.styles.accent),
+                            ("Success.TButton", self.styles.success)):
+            style.configure(name, background=color, foreground="white",
+                            font=("Helvetica", 11, "bold"), padding=(20, 8),
+                            borderwidth=0, relief="flat")
+            style.map(name, background=[("active", color)],
+                      foreground=[("disabled", "#bbbbbb")])
     
     def create_header(self):
         """Header with title and date."""
-        header = Frame(self.root, bg=self.styles["header_bg"], height=60)
+        header = ttk.Frame(self.root, style="Header.TFrame", height=60)
         header.pack(fill=X, side=TOP)
         
-        title = Label(header, text="📊 Daily Market Intelligence", 
-                     font=("Helvetica", 18, "bold"),
-                     bg=self.styles["header_bg"], fg=self.styles["text"])
+        title = ttk.Label(header, text="📊 Daily Market Intelligence",
+                          style="Title.Header.TLabel")
         title.pack(side=LEFT, padx=20, pady=15)
         
-        self.date_label = Label(header, text="", 
-                               font=("Helvetica", 10),
-                               bg=self.styles["header_bg"], fg=self.styles["text"])
+        self.date_label = ttk.Label(header, text="", style="Header.TLabel")
         self.date_label.pack(side=RIGHT, padx=20)
     
     def create_market_summary(self):
         """Market mood card."""
-        card = Frame(self.root, bg=self.styles["card_bg"], padx=20, pady=20)
+        card = ttk.Frame(self.root, style="Card.TFrame", padding=20)
         card.pack(fill=X, padx=20, pady=10)
         
-        Label(card, text="📈 Market Mood", font=("Helvetica", 14, "bold"),
-             bg=self.styles["card_bg"], fg=self.styles["text"]).pack(anchor=W)
+        ttk.Label(card, text="📈 Market Mood", style="Title.Card.TLabel").pack(anchor=W)
         
-        self.market_info = Label(card, text="Loading...", 
-                                font=("Helvetica", 12),
-                                bg=self.styles["card_bg"], fg=self.styles["text"],
-                                justify=LEFT, anchor=W)
+        self.market_info = ttk.Label(card, text="Loading...", style="Card.TLabel",
+                                     justify=LEFT, anchor=W)
         self.market_info.pack(fill=X, pady=(10, 0))
         
-        self.sentiment_label = Label(card, text="", 
-                                    font=("Helvetica", 11, "bold"),
-                                    bg=self.styles["card_bg"], fg=self.styles["warning"])
+        self.sentiment_label = ttk.Label(card, text="", style="Signal.Card.TLabel")
         self.sentiment_label.pack(anchor=W, pady=(5, 0))
     
     def create_news_section(self):
         """AI/Tech news section."""
-        card = Frame(self.root, bg=self.styles["card_bg"], padx=20, pady=20)
+        card = ttk.Frame(self.root, style="Card.TFrame", padding=20)
         card.pack(fill=BOTH, expand=True, padx=20, pady=10)
         
-        Label(card, text="🧠 AI/Tech Intelligence", 
-             font=("Helvetica", 14, "bold"),
-             bg=self.styles["card_bg"], fg=self.styles["text"]).pack(anchor=W)
+        ttk.Label(card, text="🧠 AI/Tech Intelligence", style="Title.Card.TLabel").pack(anchor=W)
         
         self.news_text = scrolledtext.ScrolledText(card, height=15, 
                                                    font=("Consolas", 10),
-                                                   bg="#0a0a15", fg=self.styles["text"],
-                                                   wrap=WORD, padx=10, pady=10)
+                                                   bg="#0a0a15", fg=self.styles.text,
+                                                   wrap=WORD, padx=10, pady=10,
+                                                   undo=False, autoseparators=False)
         self.news_text.pack(fill=BOTH, expand=True, pady=(10, 0))
     
     def create_actions(self):
         """Action buttons."""
-        actions = Frame(self.root, bg=self.styles["card_bg"], padx=20, pady=15)
+        actions = ttk.Frame(self.root, style="Card.TFrame", padding=(20, 15))
         actions.pack(fill=X, side=BOTTOM)
         
-        btn_style = {"font": ("Helvetica", 11, "bold"), 
-                    "bg": self.styles["accent"], 
-                    "fg": "white",
-                    "padx": 20, "pady": 8,
-                    "bd": 0, "cursor": "hand2"}
+        self.refresh_btn = ttk.Button(actions, text="🔄 Refresh", command=self.refresh_all,
+                                      style="Accent.TButton", cursor="hand2")
+        self.refresh_btn.pack(side=LEFT, padx=(0, 10))
         
-        Button(actions, text="🔄 Refresh", command=self.refresh_all,
-              **btn_style).pack(side=LEFT, padx=(0, 10))
+        ttk.Button(actions, text="📋 View History", command=self.show_history,
+                   style="Accent.TButton", cursor="hand2").pack(side=LEFT, padx=(0, 10))
         
-        Button(actions, text="📋 View History", command=self.show_history,
-              **btn_style).pack(side=LEFT, padx=(0, 10))
+        ttk.Button(actions, text="⚙️ Settings", command=self.show_settings,
+                   style="Accent.TButton", cursor="hand2").pack(side=LEFT, padx=(0, 10))
         
-        Button(actions, text="⚙️ Settings", command=self.show_settings,
-              **btn_style).pack(side=LEFT, padx=(0, 10))
-        
-        Button(actions, text="🌐 Open Web Dashboard", 
-              command=lambda: webbrowser.open("https://github.com/mrbooboo1987-creator/daily-intel-dashboard"),
-              **{**btn_style, "bg": self.styles["success"]}).pack(side=RIGHT)
+        ttk.Button(actions, text="🌐 Open Web Dashboard", 
+                   command=lambda: webbrowser.open("https://github.com/mrbooboo1987-creator/daily-intel-dashboard"),
+                   style="Success.TButton", cursor="hand2").pack(side=RIGHT)
     
     def create_status_bar(self):
         """Status bar at bottom."""
-        self.status = Label(self.root, text="Ready", 
-                           font=("Helvetica", 9),
-                           bg=self.styles["header_bg"], fg=self.styles["text"],
-                           anchor=W, padx=10)
+        self.status = ttk.Label(self.root, text="Ready", style="Status.TLabel", anchor=W)
         self.status.pack(fill=X, side=BOTTOM)
     
     def load_config(self):
         """Load configuration."""
         if CONFIG_FILE.exists():
-            with open(CONFIG_FILE) as f:
-                self.config = json.load(f)
+            self.config = _loads(CONFIG_FILE.read_bytes())
         else:
             self.config = {
                 "keywords": ["AI", "NVIDIA", "GPT", "OpenAI", "Tesla", "Bitcoin"],
@@ -205,35 +260,15 @@ class MarketDashboardApp:
     def set_status(self, text):
         """Update status bar."""
         self.status.config(text=f" {text}")
-        self.root.update_idletasks()
     
     def get_fear_greed_index(self):
         """Fetch Fear & Greed Index."""
-        try:
-            response = requests.get("https://api.alternative.me/fng/", timeout=10)
-            data = response.json()
-            if data.get("data"):
-                latest = data["data"][0]
-                return {
-                    "value": int(latest.get("value", 50)),
-                    "classification": latest.get("value_classification", "Neutral"),
-                }
-        except Exception as e:
-            self.log(f"Fear/Greed error: {e}")
-        return {"value": 50, "classification": "Neutral"}
+        return _marketlib.get_fear_greed_index(on_error=self.log)
     
     def analyze_sentiment(self, value):
         """Analyze sentiment value."""
-        if value <= 25:
-            return "🟢 BUY OPPORTUNITY", "Extreme Fear", self.styles["success"]
-        elif value <= 40:
-            return "🟡 CAUTIOUS", "Fear", self.styles["warning"]
-        elif value <= 60:
-            return "⚪ NEUTRAL", "Neutral", self.styles["text"]
-        elif value <= 75:
-            return "🟠 CAUTION", "Greed", self.styles["warning"]
-        else:
-            return "🔴 TAKE PROFITS", "Extreme Greed", self.styles["danger"]
+        sentiment = _marketlib.analyze_sentiment(value)
+        return sentiment.signal, sentiment.label, getattr(self.styles, sentiment.color)
     
     def fetch_news(self):
         """Fetch AI/Tech news (simplified)."""
@@ -247,31 +282,57 @@ class MarketDashboardApp:
         return news
     
     def refresh_all(self):
-        """Refresh all data."""
+        """Start a background refresh, ignoring overlapping or rapid repeat requests."""
+        if self._refreshing or time.monotonic_ns() - self._last_refresh_ns < REFRESH_DEBOUNCE_NS:
+            return
+        
+        self._refreshing = True
+        self.refresh_btn.configure(state=DISABLED)
         self.set_status("Fetching market data...")
         
-        # Fetch Fear & Greed
-        fg = self.get_fear_greed_index()
+        # Fetch Fear & Greed and news in parallel, off the Tk thread
+        self._pending = (_EXECUTOR.submit(self.get_fear_greed_index),
+                         _EXECUTOR.submit(self.fetch_news))
+        self.root.after(REFRESH_POLL_MS, self._check_ready)
+    
+    def _check_ready(self):
+        """Poll the in-flight fetches and apply them once all have finished."""
+        if not all(f.done() for f in self._pending):
+            self.root.after(REFRESH_POLL_MS, self._check_ready)
+            return
+        
+        f_fg, f_news = self._pending
+        self._pending = ()
+        try:
+            self._apply_refresh(f_fg.result(), f_news.result())
+        finally:
+            # After the "Last updated" status, so worker errors stay visible
+            self._flush_log()
+            self._refreshing = False
+            self._last_refresh_ns = time.monotonic_ns()
+            self.refresh_btn.configure(state=NORMAL)
+    
+    def _apply_refresh(self, fg, news):
+        """Update the widgets with freshly fetched data."""
         signal, label, color = self.analyze_sentiment(fg["value"])
         
         self.market_info.config(
             text=f"Fear & Greed Index: {fg['value']}/100 ({fg['classification']})"
         )
-        self.sentiment_label.config(text=f"Signal: {signal}", fg=color)
+        self.sentiment_label.config(text=f"Signal: {signal}", foreground=color)
         
-        # Fetch news
-        self.set_status("Scanning AI/Tech news...")
-        news = self.fetch_news()
+        lines = ["🧠 TOP AI/TECH INTELLIGENCE\n", "=" * 40 + "\n\n"]
+        lines.extend(f"• [{source}]\n  {title}\n\n" for source, title in news)
         
+        # Replace the whole block in one insert
+        self.news_text.configure(state=NORMAL)
         self.news_text.delete(1.0, END)
-        self.news_text.insert(END, "🧠 TOP AI/TECH INTELLIGENCE\n")
-        self.news_text.insert(END, "=" * 40 + "\n\n")
-        
-        for source, title in news:
-            self.news_text.insert(END, f"• [{source}]\n  {title}\n\n")
+        self.news_text.insert(END, "".join(lines))
+        self.news_text.configure(state=DISABLED)
         
         # Update date
-        self.date_label.config(text=datetime.now().strftime("%b %d, %Y • %H:%M"))
+        now = datetime.now()
+        self.date_label.config(text=now.strftime(_DATE_FMT))
         self.set_status("Last updated: Just now")
     
     def show_history(self):
@@ -279,17 +340,23 @@ class MarketDashboardApp:
         history_window = Toplevel(self.root)
         history_window.title("Briefing History")
         history_window.geometry("600x400")
-        history_window.configure(bg=self.styles["bg"])
+        history_window.configure(bg=self.styles.bg)
         
         text = scrolledtext.ScrolledText(history_window, font=("Consolas", 10),
-                                         bg=self.styles["card_bg"], fg=self.styles["text"])
+                                         bg=self.styles.card_bg, fg=self.styles.text)
         text.pack(fill=BOTH, expand=True, padx=10, pady=10)
         
         if BRIEFINGS_DIR.exists():
-            for f in sorted(BRIEFINGS_DIR.glob("*.md"), reverse=True)[:10]:
-                text.insert(END, f"\n📅 {f.stem}\n")
-                text.insert(END, "-" * 40 + "\n")
-                text.insert(END, f.read_text()[:2000] + "...\n")
+            # Keep only the newest N entries instead of sorting the whole directory
+            with os.scandir(BRIEFINGS_DIR) as it:
+                latest = heapq.nlargest(HISTORY_LIMIT,
+                                        (e for e in it if e.name.endswith(".md") and e.is_file()),
+                                        key=lambda e: e.name)
+            
+            parts = []
+            for entry, preview in zip(latest, _EXECUTOR.map(_read_preview, latest)):
+                parts.append(f"\n📅 {entry.name[:-3]}\n" + "-" * 40 + "\n" + preview + "...\n")
+            text.insert(END, "".join(parts))
         else:
             text.insert(END, "No history yet. Run a briefing first!")
     
@@ -298,34 +365,39 @@ class MarketDashboardApp:
         settings_window = Toplevel(self.root)
         settings_window.title("Settings")
         settings_window.geometry("500x300")
-        settings_window.configure(bg=self.styles["bg"])
+        settings_window.configure(bg=self.styles.bg)
         
-        Label(settings_window, text="⚙️ Configuration", 
-             font=("Helvetica", 14, "bold"),
-             bg=self.styles["bg"], fg=self.styles["text"]).pack(pady=20)
+        ttk.Label(settings_window, text="⚙️ Configuration",
+                  style="Title.Dialog.TLabel").pack(pady=20)
         
         # Tickers
-        Label(settings_window, text="Watchlist Tickers:", 
-             bg=self.styles["bg"], fg=self.styles["text"]).pack(anchor=W, padx=20)
+        ttk.Label(settings_window, text="Watchlist Tickers:",
+                  style="Dialog.TLabel").pack(anchor=W, padx=20)
         ticker_entry = Entry(settings_window, font=("Consolas", 11),
-                            bg=self.styles["card_bg"], fg=self.styles["text"])
+                            bg=self.styles.card_bg, fg=self.styles.text)
         ticker_entry.insert(END, ", ".join(self.config.get("portfolio_tickers", [])))
         ticker_entry.pack(fill=X, padx=20, pady=(0, 20))
         
         def save_settings():
             self.config["portfolio_tickers"] = [t.strip() for t in ticker_entry.get().split(",")]
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(self.config, f, indent=2)
+            CONFIG_FILE.write_bytes(_dumps(self.config))
             settings_window.destroy()
             messagebox.showinfo("Settings", "Settings saved!")
         
-        Button(settings_window, text="💾 Save Settings", command=save_settings,
-              bg=self.styles["success"], fg="white", font=("Helvetica", 11, "bold"),
-              bd=0, padx=20, pady=8).pack(pady=20)
+        ttk.Button(settings_window, text="💾 Save Settings", command=save_settings,
+                   style="Success.TButton").pack(pady=20)
     
     def log(self, message):
-        """Log to status bar."""
-        self.set_status(message)
+        """Log to status bar; worker threads queue messages for the Tk thread."""
+        if threading.current_thread() is threading.main_thread():
+            self.set_status(message)
+        else:
+            self._log_queue.put(message)
+    
+    def _flush_log(self):
+        """Show status messages queued by worker threads."""
+        while not self._log_queue.empty():
+            self.set_status(self._log_queue.get())
 
 
 def main():
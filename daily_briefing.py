@@ -4,23 +4,26 @@ Daily Market Intelligence Dashboard
 Your AI-powered morning briefing
 """
 
-import json
 import os
+import sched
+import signal
 import sys
 import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Final, List, Optional
+from zoneinfo import ZoneInfo
 
-try:
-    import requests
-    from bs4 import BeautifulSoup
-except ImportError:
-    print("Install: pip install requests beautifulsoup4")
-    sys.exit(1)
+from app import _marketlib
+from app._marketlib import loads as _loads
 
 
 # Configuration
 CONFIG_FILE = "config.json"
+_LOG_TIME_FMT = "%H:%M:%S"
+_DATE_FMT = "%b %d, %Y"
+_GENERATED_FMT = "%Y-%m-%d %H:%M:%S"
+
 DEFAULT_CONFIG = {
     "news_sources": {
         "reddit_ai": ["Artificial", "AI_Agents", "MachineLearning"],
@@ -29,43 +32,36 @@ DEFAULT_CONFIG = {
     },
     "keywords": ["AI", "NVIDIA", "GPT", "OpenAI", "Tesla", "Bitcoin", "cloud"],
     "timezone": "America/New_York",
+    "daemon_hours": [6, 12, 18],
     "notify_discord": False,
     "discord_channel": "",
 }
 
+# Shared worker pool for network fetches
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
 
 def load_config() -> Dict:
     """Load configuration from file."""
     if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE) as f:
-            config = json.load(f)
-            # Merge with defaults
-            for key, value in DEFAULT_CONFIG.items():
-                if key not in config:
-                    config[key] = value
-            return config
+        with open(CONFIG_FILE, "rb") as f:
+            config = _loads(f.read())
+        # Merge with defaults
+        for key, value in DEFAULT_CONFIG.items():
+            if key not in config:
+                config[key] = value
+        return config
     return DEFAULT_CONFIG.copy()
 
 
 def log(message: str) -> None:
     """Print timestamped message."""
-    print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+    print(f"[{datetime.now().strftime(_LOG_TIME_FMT)}] {message}")
 
 
 def get_fear_greed_index() -> Dict:
     """Fetch market Fear & Greed Index."""
-    try:
-        response = requests.get("https://api.alternative.me/fng/", timeout=10)
-        data = response.json()
-        if data.get("data"):
-            latest = data["data"][0]
-            return {
-                "value": int(latest.get("value", 50)),
-                "classification": latest.get("value_classification", "Neutral"),
-            }
-    except Exception as e:
-        log(f"Fear/Greed fetch error: {e}")
-    return {"value": 50, "classification": "Neutral"}
+    return _marketlib.get_fear_greed_index(on_error=log)
 
 
 def scrape_reddit_ai() -> List[Dict]:
@@ -129,83 +125,80 @@ def get_market_summary() -> Dict:
     fg = get_fear_greed_index()
     
     # Determine sentiment
-    value = fg["value"]
-    if value <= 25:
-        sentiment = "🟢 BUY OPPORTUNITY — Extreme Fear"
-        advice = "Contrarian signal. High fear often precedes rallies."
-    elif value <= 40:
-        sentiment = "🟡 CAUTIOUS OPTIMISM — Fear"
-        advice = "Building positions on dips."
-    elif value <= 60:
-        sentiment = "⚪ NEUTRAL"
-        advice = "No strong directional signal."
-    elif value <= 75:
-        sentiment = "🟠 CAUTION — Greed"
-        advice = "Momentum slowing. Watch for exhaustion."
-    else:
-        sentiment = "🔴 TAKE PROFITS — Extreme Greed"
-        advice = "Market likely overextended."
+    sentiment = _marketlib.analyze_sentiment(fg["value"])
     
     return {
         "fear_greed": fg,
-        "sentiment": sentiment,
-        "advice": advice,
+        "sentiment": sentiment.headline,
+        "advice": sentiment.advice,
     }
 
 
-def generate_briefing() -> str:
-    """Generate the daily briefing."""
-    log("Generating morning briefing...")
-    
-    config = load_config()
-    market = get_market_summary()
-    ai_news = scrape_reddit_ai()
-    tech_news = scrape_tech_news()
-    
-    date = datetime.now().strftime("%b %d, %Y")
-    
-    # Build the report
-    report = f"""
+# Briefing frame, built once at import
+_HEADER_TMPL: Final[str] = """
 ╔══════════════════════════════════════════════════════════════╗
 ║        📊 DAILY MARKET INTELLIGENCE — {date:<28}║
 ╠══════════════════════════════════════════════════════════════╣
 ║  🧠 AI/TECH INTELLIGENCE                                     ║
 ╠══════════════════════════════════════════════════════════════╣"""
-    
-    # Add top AI news
-    for item in ai_news[:3]:
-        report += f"""
-║  • [{item['source']}] {item['title'][:50]}"""
-    
-    report += """
+_TECH_HEADER: Final[str] = """
 ╠══════════════════════════════════════════════════════════════╣
 ║  📰 TECH SECTOR NEWS                                          ║
 ╠══════════════════════════════════════════════════════════════╣"""
-    
-    for item in tech_news:
-        report += f"""
-║  • [{item['source']}] {item['title'][:50]}"""
-    
-    report += f"""
+_NEWS_ITEM_TMPL: Final[str] = """
+║  • [{source}] {title}"""
+_MOOD_TMPL: Final[str] = """
 ╠══════════════════════════════════════════════════════════════╣
 ║  📈 MARKET MOOD                                               ║
-║  Fear & Greed: {market['fear_greed']['value']}/100 ({market['fear_greed']['classification']})"""
-    
-    report += f"""
-║  Sentiment: {market['sentiment']}"""
-    report += f"""
-║  → {market['advice']}"""
-    
-    report += """
+║  Fear & Greed: {value}/100 ({classification})
+║  Sentiment: {sentiment}
+║  → {advice}"""
+_FOOTER: Final[str] = """
 ╠══════════════════════════════════════════════════════════════╣
 ║  🎯 TODAY'S WATCH                                              ║
 ║  • Earnings season continue (AMZN, GOOGL upcoming)            ║
 ║  • AI capex guidance from cloud providers                     ║
 ║  • Bitcoin sentiment extremes — contrarian plays              ║
 ╚══════════════════════════════════════════════════════════════╝
-Generated: """ + datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+Generated: """
+
+
+def generate_briefing() -> str:
+    """Generate the daily briefing."""
+    log("Generating morning briefing...")
+    
+    config = load_config()
+    
+    # Fetch all sources in parallel
+    f_market = _EXECUTOR.submit(get_market_summary)
+    f_ai = _EXECUTOR.submit(scrape_reddit_ai)
+    f_tech = _EXECUTOR.submit(scrape_tech_news)
+    market = f_market.result()
+    ai_news = f_ai.result()
+    tech_news = f_tech.result()
+    
+    now = datetime.now()
+    date = now.strftime(_DATE_FMT)
+    
+    # Build the report
+    parts = [_HEADER_TMPL.format(date=date)]
+    
+    # Add top AI news
+    parts.extend(_NEWS_ITEM_TMPL.format(source=item["source"], title=item["title"][:50])
+                 for item in ai_news[:3])
+    
+    parts.append(_TECH_HEADER)
+    parts.extend(_NEWS_ITEM_TMPL.format(source=item["source"], title=item["title"][:50])
+                 for item in tech_news)
+    
+    fg = market["fear_greed"]
+    parts.append(_MOOD_TMPL.format(value=fg["value"], classification=fg["classification"],
+                                   sentiment=market["sentiment"], advice=market["advice"]))
     
-    return report
+    parts.append(_FOOTER)
+    parts.append(now.strftime(_GENERATED_FMT))
+    
+    return "".join(parts)
 
 
 def save_briefing(report: str) -> None:
@@ -218,6 +211,43 @@ def save_briefing(report: str) -> None:
     log(f"Briefing saved to {filename}")
 
 
+def next_run_time(hours: List[int], tz: ZoneInfo) -> datetime:
+    """Return the next wall-clock slot (on the hour) strictly after now."""
+    now = datetime.now(tz)
+    for day_offset in range(2):
+        day = (now + timedelta(days=day_offset)).date()
+        for hour in sorted(hours):
+            candidate = datetime(day.year, day.month, day.day, hour, tzinfo=tz)
+            if candidate > now:
+                return candidate
+    raise ValueError(f"No valid daemon hours in {hours!r}")
+
+
+def run_daemon(config: Dict) -> None:
+    """Generate briefings at fixed wall-clock hours until terminated."""
+    tz = ZoneInfo(config["timezone"])
+    hours = config["daemon_hours"]
+    scheduler = sched.scheduler(time.time, time.sleep)
+    
+    def schedule_next() -> None:
+        target = next_run_time(hours, tz)
+        log(f"Next briefing at {target:%Y-%m-%d %H:%M %Z}")
+        scheduler.enterabs(target.timestamp(), 1, run_once)
+    
+    def run_once() -> None:
+        report = generate_briefing()
+        sys.stdout.write(report)
+        sys.stdout.write("\n")
+        save_briefing(report)
+        schedule_next()
+    
+    # Exit promptly on systemd stop instead of finishing the sleep
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    
+    run_once()
+    scheduler.run()
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -231,16 +261,12 @@ def main():
     
     if args.daemon:
         log("Starting daemon mode...")
-        while True:
-            report = generate_briefing()
-            print(report)
-            save_briefing(report)
-            log("Sleeping 6 hours...")
-            time.sleep(21600)
+        run_daemon(load_config())
     
     elif args.today or args.full:
         report = generate_briefing()
-        print(report)
+        sys.stdout.write(report)
+        sys.stdout.write("\n")
         save_briefing(report)
     
     else: